@@ -1,51 +1,71 @@
 """Module necessary for CLI functionality."""
 
+import argparse
+import json
 from pathlib import Path
 import sys
 from typing import Callable
-from mazefinder.search import (
-    bfs,
-    iterator_dfs,
-    stack_dfs,
-    recursive_dfs,
-    dijkstra,
-    greedy_manhattan,
-    greedy_euclidean,
-    a_star_manhattan,
-    a_star_euclidean,
-    a_star_overweight_manhattan,
-    a_star_overweight_euclidean,
-    random_search,
-)
+from mazefinder.search import ALGORITHMS, load_algorithm
 from mazefinder.animate import Animator
-from mazefinder.problem import load_problem
+from mazefinder.problem import (
+    load_problem,
+    load_tiled_problem,
+    TILE_CACHE_DEFAULT,
+    Neighborhood,
+    CornerCutting,
+    NEIGHBORHOODS,
+    FOUR_CONNECTED,
+    EIGHT_CONNECTED,
+)
 
 
 A_STAR_ALGORITHMS = {
-    "1": ("A* (Manhattan)", a_star_manhattan),
-    "2": ("A* (Euclidean)", a_star_euclidean),
-    "3": ("A* (Overweight Manhattan)", a_star_overweight_manhattan),
-    "4": ("A* (Overweight Euclidean)", a_star_overweight_euclidean),
+    "1": ("A* (Manhattan)", "a_star_manhattan"),
+    "2": ("A* (Euclidean)", "a_star_euclidean"),
+    "3": ("A* (Octile)", "a_star_octile"),
+    "4": ("A* (Chebyshev)", "a_star_chebyshev"),
+    "5": ("A* (Overweight Manhattan)", "a_star_overweight_manhattan"),
+    "6": ("A* (Overweight Euclidean)", "a_star_overweight_euclidean"),
+}
+
+ARA_STAR_ALGORITHMS = {
+    "1": ("ARA* (Manhattan)", "ara_star_manhattan"),
+    "2": ("ARA* (Euclidean)", "ara_star_euclidean"),
+    "3": ("ARA* (Octile)", "ara_star_octile"),
 }
 
 GREEDY_ALGORITHMS = {
-    "1": ("Greedy (Manhattan)", greedy_manhattan),
-    "2": ("Greedy (Euclidean)", greedy_euclidean),
+    "1": ("Greedy (Manhattan)", "greedy_manhattan"),
+    "2": ("Greedy (Euclidean)", "greedy_euclidean"),
+    "3": ("Greedy (Octile)", "greedy_octile"),
+    "4": ("Greedy (Chebyshev)", "greedy_chebyshev"),
 }
 
 DFS_ALGORITHMS = {
-    "1": ("Stack-based iterator DFS", iterator_dfs),
-    "2": ("Stack-based naive DFS", stack_dfs),
-    "3": ("Recursive DFS", recursive_dfs),
+    "1": ("Stack-based iterator DFS", "iterator_dfs"),
+    "2": ("Stack-based naive DFS", "stack_dfs"),
+    "3": ("Recursive DFS", "recursive_dfs"),
 }
 
 SEARCH_ALGORITHMS = {
     "1": ("A*", A_STAR_ALGORITHMS),
     "2": ("Greedy", GREEDY_ALGORITHMS),
     "3": ("DFS", DFS_ALGORITHMS),
-    "4": ("BFS", bfs),
-    "5": ("Dijkstra", dijkstra),
-    "6": ("Random", random_search),
+    "4": ("BFS", "bfs"),
+    "5": ("Dijkstra", "dijkstra"),
+    "6": ("Random", "random_search"),
+    "7": ("ARA*", ARA_STAR_ALGORITHMS),
+}
+
+NEIGHBORHOOD_OPTIONS = {
+    "1": ("4-connected", FOUR_CONNECTED),
+    "2": ("8-connected", EIGHT_CONNECTED),
+    "3": (
+        "8-connected with corner cutting",
+        Neighborhood(
+            EIGHT_CONNECTED.moves, EIGHT_CONNECTED.costs, CornerCutting.ALLOW
+        ),
+    ),
 }
 
 def compress_path(path: list) -> list:
@@ -55,15 +75,26 @@ def compress_path(path: list) -> list:
     return path
 
 
-def solve_maze(file_path: str, search_strategy: Callable, animator: Animator):
-    """Solve a maze from file."""
-    problem = load_problem(file_path)
-    animator.set_frame_interval(len(problem.grid.data), len(problem.grid.data[0]))
+def solve_maze(
+    file_path: str,
+    search_strategy: Callable,
+    animator: Animator,
+    neighborhood: Neighborhood = FOUR_CONNECTED,
+    cache_tiles: int = TILE_CACHE_DEFAULT,
+):
+    """Solve a maze from a text or tiled file."""
+    if Path(file_path).suffix == TILED_SUFFIX:
+        problem = load_tiled_problem(file_path, neighborhood, cache_tiles)
+        animator.headless = True
+    else:
+        problem = load_problem(file_path, neighborhood)
+    animator.set_frame_interval(problem.height, problem.width)
     animator.draw(problem.grid)
     path, cells_visited = search_strategy(problem, animator)
     if path:
         animator.draw(problem.grid)
-    return path, cells_visited
+    hit_rate = problem.tiles.hit_rate if Path(file_path).suffix == TILED_SUFFIX else None
+    return path, cells_visited, hit_rate
 
 
 def get_map_files(folder_paths):
@@ -71,9 +102,8 @@ def get_map_files(folder_paths):
     all_files = []
     for folder in folder_paths:
         folder_path = Path(folder)
-        folder_path.mkdir(exist_ok=True)
-        files = list(folder_path.glob("*.txt"))
-        all_files.extend(files)
+        if folder_path.is_dir():
+            all_files.extend(folder_path.glob("*.txt"))
     return all_files
 
 
@@ -90,17 +120,116 @@ def display_menu(options, title):
 
 
 MAP_FOLDERS = ("mazes", )
+TILED_SUFFIX = ".mzt"
 SECONDS_PER_FRAME_DEFAULT = 0.1
 SIMULATION_SPEED_DEFAULT = 10
 
 
-def main():
+def format_result(
+    path, nodes_visited, output_format: str, tile_hit_rate: float | None = None
+) -> str:
+    """Format a search result as text or json."""
+    if output_format == "json":
+        return json.dumps(
+            {
+                "nodes_visited": nodes_visited,
+                "tile_hit_rate": tile_hit_rate,
+                "path_length": len(path) if path else None,
+                "path": (
+                    [[position.column, position.row] for position in path]
+                    if path
+                    else None
+                ),
+            }
+        )
+    lines = [f"Nodes visited: {nodes_visited}"]
+    if tile_hit_rate is not None:
+        lines.append(f"Tile cache hit rate: {tile_hit_rate:.2%}")
+    if path:
+        compressed = " -> ".join(str(position) for position in compress_path(path))
+        lines.append(f"Path length: {len(path)}\nPath: {compressed}")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Solve mazes with classic search algorithms. "
+        "Runs an interactive menu unless both --maze and --algorithm are given."
+    )
+    parser.add_argument(
+        "--maze",
+        type=Path,
+        help=f"path of the maze file to solve, text or tiled ({TILED_SUFFIX})",
+    )
+    parser.add_argument(
+        "--algorithm",
+        choices=ALGORITHMS,
+        metavar="NAME",
+        help=f"search algorithm, one of: {', '.join(ALGORITHMS)}",
+    )
+    parser.add_argument(
+        "--neighborhood", choices=NEIGHBORHOODS, default="4", help="moves per cell"
+    )
+    parser.add_argument(
+        "--corner-cutting",
+        choices=[rule.value for rule in CornerCutting],
+        default=CornerCutting.FORBID.value,
+        help="rule for diagonal moves passing by walls",
+    )
+    parser.add_argument(
+        "--headless", action="store_true", help="skip the terminal animation"
+    )
+    parser.add_argument(
+        "--format", choices=("text", "json"), default="text", help="output format"
+    )
+    parser.add_argument(
+        "--tile-cache",
+        type=int,
+        default=TILE_CACHE_DEFAULT,
+        help="tiles kept in memory for tiled mazes",
+    )
+    parser.add_argument(
+        "--seconds-per-frame", type=float, default=SECONDS_PER_FRAME_DEFAULT
+    )
+    parser.add_argument(
+        "--simulation-speed", type=float, default=SIMULATION_SPEED_DEFAULT
+    )
+    return parser.parse_args(argv)
+
+
+def run_once(args: argparse.Namespace):
+    """Solve a single maze selected through command line arguments."""
+    base = NEIGHBORHOODS[args.neighborhood]
+    neighborhood = Neighborhood(
+        base.moves, base.costs, CornerCutting(args.corner_cutting)
+    )
+    path, nodes_visited, tile_hit_rate = solve_maze(
+        args.maze,
+        load_algorithm(args.algorithm),
+        Animator(
+            args.seconds_per_frame,
+            args.simulation_speed,
+            f"{args.maze.name}: {args.algorithm}",
+            headless=args.headless,
+        ),
+        neighborhood,
+        args.tile_cache,
+    )
+    print(format_result(path, nodes_visited, args.format, tile_hit_rate))
+
+
+def main(argv=None):
     """Run the CLI application."""
+    args = parse_args(argv)
+    if args.maze and args.algorithm:
+        run_once(args)
+        return
 
     map_files = get_map_files(MAP_FOLDERS)
     if not map_files:
         print(f"No map files found in {MAP_FOLDERS} directories.")
-        print("Please add some .txt files with graph edges (format: 'v w' per line)")
+        print("Please add some .txt maze files or pass one with --maze.")
         sys.exit(1)
 
     map_options = {
@@ -129,6 +258,12 @@ def main():
             print(f"Selected variant: {variant_name}")
         else:
             variant_name, variant_func = algorithm_name, algorithm_options
+        variant_func = load_algorithm(variant_func)
+
+        # Neighborhood selection
+        neighborhood_choice = display_menu(NEIGHBORHOOD_OPTIONS, "Select moves")
+        neighborhood_name, neighborhood = NEIGHBORHOOD_OPTIONS[neighborhood_choice]
+        print(f"Selected moves: {neighborhood_name}")
 
         seconds_per_frame = input(
             f"Set seconds per animated frame (default {SECONDS_PER_FRAME_DEFAULT}): "
@@ -148,24 +283,23 @@ def main():
             else float(SIMULATION_SPEED_DEFAULT)
         )
 
-        path, nodes_visited = solve_maze(
+        path, nodes_visited, _ = solve_maze(
             map_path,
             variant_func,
             Animator(
                 seconds_per_frame,
                 simulation_speed,
-                f"{map_name}: {variant_name}",
+                f"{map_name}: {variant_name} ({neighborhood_name})",
+                headless=args.headless,
             ),
+            neighborhood,
         )
 
-        print(f"Nodes visited: {nodes_visited}")
-        if path:
-            print(
-                f"Path length: {len(path)}\nPath: {" -> ".join((str(position) for position in compress_path(path)))}"
-            )
+        print(format_result(path, nodes_visited, args.format))
 
         if input("\nRun again? (y/n): ").lower() != "y":
             break
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -13,12 +13,15 @@ class Animator:
     seconds_per_frame: float
     simulation_speed: int = 100
     label: str = ""
+    headless: bool = False  # skip drawing, e.g. for batch runs
 
     moves_per_frame: int = field(default=1, init=False)
     frame_counter: int = field(default=0, init=False)
 
     def draw(self, grid):
         """Draw to screen efficiently."""
+        if self.headless:
+            return
         os.system("cls" if os.name == "nt" else "clear")
         full_grid = "\n".join("".join(cell.value for cell in row) for row in grid.data)
         print(f"{full_grid}\n{self.label}", flush=True)
@@ -39,6 +42,8 @@ class Animator:
 
     def next_frame(self, grid: Grid):
         """Print the next frame to the terminal after delay."""
+        if self.headless:
+            return
         self.frame_counter = (self.frame_counter + 1) % self.moves_per_frame
         if self.frame_counter == 0:
             self.draw(grid)
@@ -1 +1,2 @@
 from .problem import *
+from .tiled import *
@@ -1,8 +1,11 @@
 """Defines the abstract and concrete formal problem."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from copy import copy
 from enum import Enum
+from functools import cached_property
+from typing import Callable, Iterable, Sequence
 import math
 import re
 
@@ -37,12 +40,131 @@ ROOT = Position(-1, -1)
 
 
 class Move(Enum):
-    "Possible moves in a 2D grid. (column, row)"
+    "Named unit moves in a 2D grid. (column, row)"
 
-    UP = Position(1, 0)
-    DOWN = Position(-1, 0)
-    LEFT = Position(0, -1)
-    RIGHT = Position(0, 1)
+    UP = Position(0, -1)
+    DOWN = Position(0, 1)
+    LEFT = Position(-1, 0)
+    RIGHT = Position(1, 0)
+    UP_LEFT = Position(-1, -1)
+    UP_RIGHT = Position(1, -1)
+    DOWN_LEFT = Position(-1, 1)
+    DOWN_RIGHT = Position(1, 1)
+
+
+class CornerCutting(Enum):
+    "Rules for diagonal moves that pass by walls."
+
+    ALLOW = "allow"  # walls next to the diagonal are ignored
+    NO_SQUEEZE = "no_squeeze"  # blocked only when both side cells are walls
+    FORBID = "forbid"  # blocked when any side cell is a wall
+
+
+@dataclass(frozen=True)
+class Neighborhood:
+    """Defines the moves available from every cell and their costs."""
+
+    moves: tuple[Position, ...]
+    costs: tuple[float, ...]
+    corner_cutting: CornerCutting = CornerCutting.FORBID
+
+    def __post_init__(self):
+        """Validate the move table."""
+        if len(self.moves) != len(self.costs):
+            raise ValueError("every move needs exactly one cost")
+        if len(set(self.moves)) != len(self.moves):
+            raise ValueError("moves must be unique")
+        if Position(0, 0) in self.moves:
+            raise ValueError("moves must change the position")
+        if any(cost <= 0 for cost in self.costs):
+            raise ValueError("move costs must be positive")
+        if len(self.moves) > 255:
+            raise ValueError("at most 255 moves fit into a parent direction byte")
+
+    @classmethod
+    def from_offsets(
+        cls,
+        offsets: Iterable[tuple[int, int] | tuple[int, int, float]],
+        corner_cutting: CornerCutting = CornerCutting.FORBID,
+    ) -> "Neighborhood":
+        """Build a neighborhood from (column, row[, cost]) offsets.
+
+        Offsets without a cost are charged their euclidean length.
+        """
+        moves, costs = [], []
+        for offset in offsets:
+            column, row = offset[0], offset[1]
+            moves.append(Position(column, row))
+            costs.append(offset[2] if len(offset) > 2 else math.hypot(column, row))
+        return cls(tuple(moves), tuple(costs), corner_cutting)
+
+    @cached_property
+    def reach(self) -> int:
+        """Return the largest distance along one axis covered by a move."""
+        return max(max(abs(move.column), abs(move.row)) for move in self.moves)
+
+    @cached_property
+    def straight_cost(self) -> float:
+        """Return the cheapest cost of a unit orthogonal move."""
+        costs = [
+            cost
+            for move, cost in zip(self.moves, self.costs)
+            if abs(move.column) + abs(move.row) == 1
+        ]
+        return min(costs, default=min(self.costs))
+
+    @cached_property
+    def diagonal_cost(self) -> float:
+        """Return the cheapest cost of a unit diagonal move.
+
+        Without diagonal moves a diagonal step takes two straight moves.
+        """
+        costs = [
+            cost
+            for move, cost in zip(self.moves, self.costs)
+            if abs(move.column) == abs(move.row) == 1
+        ]
+        return min(costs, default=2 * self.straight_cost)
+
+    @cached_property
+    def diagonal_ratio(self) -> float:
+        """Return the octile length of a unit diagonal move, between 1 and 2."""
+        return min(max(self.diagonal_cost / self.straight_cost, 1.0), 2.0)
+
+    def cost_per_length(self, norm: Callable[[int, int], float]) -> float:
+        """Return the cheapest cost per unit of 'norm' length over all moves.
+
+        A path is never cheaper than its displacement measured by 'norm'
+        times this rate.
+        """
+        return min(
+            cost / norm(abs(move.column), abs(move.row))
+            for move, cost in zip(self.moves, self.costs)
+        )
+
+    def guards(self, move: Position) -> tuple[Position, ...]:
+        """Return the side offsets a diagonal unit move passes between."""
+        if self.corner_cutting == CornerCutting.ALLOW:
+            return ()
+        if abs(move.column) != 1 or abs(move.row) != 1:
+            return ()
+        return (Position(move.column, 0), Position(0, move.row))
+
+
+FOUR_CONNECTED = Neighborhood(
+    moves=(Move.UP.value, Move.DOWN.value, Move.LEFT.value, Move.RIGHT.value),
+    costs=(1.0, 1.0, 1.0, 1.0),
+)
+
+EIGHT_CONNECTED = Neighborhood(
+    moves=tuple(move.value for move in Move),
+    costs=(1.0,) * 4 + (math.sqrt(2),) * 4,
+)
+
+NEIGHBORHOODS = {
+    "4": FOUR_CONNECTED,
+    "8": EIGHT_CONNECTED,
+}
 
 
 class Cell(Enum):
@@ -104,83 +226,405 @@ class Problem(ABC):
         raise NotImplementedError
 
 
+HEURISTICS = ("manhattan", "euclidean", "octile", "chebyshev")
+
+# (direction, flat offset, cost, flat guard offsets) row of the expansion table
+Step = tuple[int, int, float, tuple[int, ...]]
+
+
 @dataclass
 class MazeProblem(Problem):
-    """Specification of the maze problem."""
+    """Specification of the maze problem.
+
+    Searches address cells by integer ids into a flat wall table padded with
+    walls by the neighborhood reach, so expansion never needs bounds checks.
+    Assigning the ends or the neighborhood recomputes the ids derived from
+    them.
+    """
+
+    # fields whose assignment refreshes the cell ids derived from them
+    _GOAL_FIELDS = ("initial", "goal")
 
     initial: Position
     goal: Position
     grid: Grid
+    neighborhood: Neighborhood = FOUR_CONNECTED
+
+    width: int = field(init=False)
+    height: int = field(init=False)
+    padding: int = field(init=False, repr=False)
+    stride: int = field(init=False, repr=False)
+    size: int = field(init=False, repr=False)
+    walls: Sequence[int] = field(init=False, repr=False)  # 1 for walls, by cell id
+    steps: tuple[Step, ...] = field(init=False, repr=False)
+    squeeze: bool = field(init=False, repr=False)
+    integral_costs: bool = field(init=False, repr=False)
+    initial_cell: int = field(init=False, repr=False)
+    goal_cell: int = field(init=False, repr=False)
+    goal_cells: frozenset[int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Precompute the flat wall and expansion tables."""
+        self.height = len(self.grid.data)
+        self.width = max((len(row) for row in self.grid.data), default=0)
+        self.index_cells()
+
+        self.walls = bytearray(b"\x01") * self.size
+        for row, cells in enumerate(self.grid.data):
+            start = self.cell(Position(0, row))
+            self.walls[start : start + len(cells)] = bytes(
+                cell == Cell.WALL for cell in cells
+            )
+
+    def index_cells(self):
+        """Lay out cell ids for the grid shape and precompute the move table."""
+        self.padding = self.neighborhood.reach
+        self.stride = self.width + 2 * self.padding
+        self.size = self.stride * (self.height + 2 * self.padding)
+
+        self.integral_costs = all(cost == int(cost) for cost in self.neighborhood.costs)
+        self.steps = tuple(
+            (
+                direction,
+                self.offset(move),
+                int(cost) if self.integral_costs else cost,
+                tuple(self.offset(guard) for guard in self.neighborhood.guards(move)),
+            )
+            for direction, (move, cost) in enumerate(
+                zip(self.neighborhood.moves, self.neighborhood.costs), start=1
+            )
+        )
+        self.squeeze = self.neighborhood.corner_cutting == CornerCutting.NO_SQUEEZE
+        self.index_goals()
+
+    def index_goals(self):
+        """Compute the cell ids of the start and the goals."""
+        self.initial_cell = self.cell(self.initial)
+        self.goal_cell = self.cell(self.goal)
+        self.goal_cells = frozenset((self.goal_cell,))
+
+    def __setattr__(self, name: str, value):
+        """Keep derived cell ids in step once the problem is built."""
+        super().__setattr__(name, value)
+        if "goal_cells" not in self.__dict__:
+            return
+        if name == "neighborhood":
+            if value.reach == self.padding:
+                self.index_cells()
+            else:
+                self.__post_init__()
+        elif name in self._GOAL_FIELDS:
+            self.index_goals()
+
+    def cell(self, position: Position) -> int:
+        """Return the id of the cell at a position."""
+        return (position.row + self.padding) * self.stride + position.column + self.padding
+
+    def position(self, cell: int) -> Position:
+        """Return the position of a cell id."""
+        row, column = divmod(cell, self.stride)
+        return Position(column - self.padding, row - self.padding)
+
+    def offset(self, move: Position) -> int:
+        """Return the difference in cell ids caused by a move."""
+        return move.row * self.stride + move.column
+
+    def neighbors(self, cell: int):
+        """Yield (direction, neighbor) pairs for moves allowed from a cell.
+
+        The direction is the 1-based index of the move in the neighborhood.
+        """
+        return (
+            (direction, neighbor) for direction, _, neighbor in self.neighbors_weighted(cell)
+        )
+
+    def neighbors_weighted(self, cell: int):
+        """Yield (direction, cost, neighbor) triples for moves allowed from a cell."""
+        walls = self.walls
+        for direction, offset, cost, guards in self.steps:
+            neighbor = cell + offset
+            if walls[neighbor]:
+                continue
+            if guards:
+                first, second = walls[cell + guards[0]], walls[cell + guards[1]]
+                if (first and second) if self.squeeze else (first or second):
+                    continue
+            yield direction, cost, neighbor
 
     def actions(self, state: Position):
         """Return permissible moves for a state."""
-        return (move for move in Move if not self.grid.wall(state + move.value))
+        moves = self.neighborhood.moves
+        return (moves[direction - 1] for direction, _ in self.neighbors(self.cell(state)))
 
-    def result(self, state: Position, action: Move) -> Position:
+    def result(self, state: Position, action: Position) -> Position:
         """Return the resulting position for a given move and state."""
-        return state + action.value
+        return state + action
 
     def adjacent(self, state: Position):
         """Return adjacent positions to a given state."""
-        return (self.result(state, action) for action in self.actions(state))
+        return (self.position(cell) for _, cell in self.neighbors(self.cell(state)))
 
     def adjacent_weighted(self, state: Position):
-        """Return adjacent positions with added dummy weight."""
-        return ((1.0, self.result(state, action)) for action in self.actions(state))
+        """Return adjacent positions together with the cost of the move."""
+        return (
+            (cost, self.position(cell))
+            for _, cost, cell in self.neighbors_weighted(self.cell(state))
+        )
+
+    def visit(self, cell: int) -> None:
+        """Mark a cell as visited in the grid."""
+        self.grid.visit(self.position(cell))
+
+    def start_search(self) -> None:
+        """Reset per-search statistics before a search starts."""
 
     def manhattan(self, state: Position) -> float:
         """Calculate the manhattan distance of a state from goal."""
-        return abs(state.column - self.goal.column) + abs(state.row - self.goal.row)
+        return self.heuristic("manhattan")(self.cell(state))
 
     def euclidean(self, state: Position) -> float:
-        """Calculate the manhattan distance of a state from goal."""
-        return math.sqrt(
-            (state.column - self.goal.column) ** 2 + (state.row - self.goal.row) ** 2
-        )
+        """Calculate the euclidean distance of a state from goal."""
+        return self.heuristic("euclidean")(self.cell(state))
+
+    def octile(self, state: Position) -> float:
+        """Calculate the octile distance of a state from goal."""
+        return self.heuristic("octile")(self.cell(state))
+
+    def chebyshev(self, state: Position) -> float:
+        """Calculate the chebyshev distance of a state from goal."""
+        return self.heuristic("chebyshev")(self.cell(state))
+
+    def heuristic(self, method: str) -> Callable[[int], float]:
+        """Return the heuristic called 'method' as a function of cell ids."""
+        distance = self.distance(method)
+        stride = self.stride
+        goal_row, goal_column = divmod(self.goal_cell, stride)
+
+        def estimate(cell: int) -> float:
+            """Estimate the cost of reaching goal from a cell."""
+            row, column = divmod(cell, stride)
+            return distance(abs(column - goal_column), abs(row - goal_row))
+
+        return estimate
+
+    def distance(self, method: str) -> Callable[[int, int], float]:
+        """Return the distance called 'method' as a function of (dx, dy).
+
+        The distance is scaled by the cheapest move cost per unit of its
+        length, so it never overestimates the cost of reaching goal.
+        """
+        if method not in HEURISTICS:
+            raise NotImplementedError(f"choose one of {', '.join(HEURISTICS)} as method")
+        norm = getattr(self, f"_{method}")
+        rate = self.neighborhood.cost_per_length(norm)
+        if rate == 1:
+            return norm
+        return lambda dx, dy: rate * norm(dx, dy)
+
+    def _manhattan(self, dx: int, dy: int) -> float:
+        """Return the manhattan distance of a coordinate difference."""
+        return dx + dy
+
+    def _euclidean(self, dx: int, dy: int) -> float:
+        """Return the euclidean distance of a coordinate difference."""
+        return math.sqrt(dx**2 + dy**2)
+
+    def _octile(self, dx: int, dy: int) -> float:
+        """Return the octile distance of a coordinate difference."""
+        return dx + dy + (self.neighborhood.diagonal_ratio - 2) * min(dx, dy)
+
+    def _chebyshev(self, dx: int, dy: int) -> float:
+        """Return the chebyshev distance of a coordinate difference."""
+        return max(dx, dy)
 
     def is_goal(self, state):
         """Returns True if state is the position of maze end."""
         return state == self.goal
 
-    def reconstruct_path(self, previous: dict[Position, Position]):
-        """Return a permissible solution to the maze problem."""
-        path = [self.goal]
-        if self.goal == self.initial:
-            return path
-        current = previous[self.goal]
-        while current != self.initial:
-            path.append(current)
-            self.grid.path(current)
-            current = previous[current]
-        path.append(self.initial)
+    def with_goals(self, goals: Iterable[Position]) -> "MultiGoalMazeProblem":
+        """Return the same maze solved by reaching any of 'goals'.
+
+        The new problem draws on a copy of the grid, so this one is unchanged.
+        """
+        goals = self.check_goals(goals)
+        grid = copy(self.grid)
+        grid.data = [list(row) for row in self.grid.data]
+        for cell in self.goal_cells:
+            goal = self.position(cell)
+            grid.data[goal.row][goal.column] = Cell.EMPTY
+        for goal in goals:
+            grid.data[goal.row][goal.column] = Cell.END
+        return MultiGoalMazeProblem(self.initial, goals[0], grid, self.neighborhood, goals)
+
+    def check_goals(self, goals: Iterable[Position]) -> tuple[Position, ...]:
+        """Return goals as a tuple, raise ValueError unless all are open cells."""
+        goals = tuple(goals)
+        if not goals:
+            raise ValueError("at least one goal is needed")
+        for goal in goals:
+            inside = 0 <= goal.column < self.width and 0 <= goal.row < self.height
+            if not inside or self.walls[self.cell(goal)]:
+                raise ValueError(f"goal {goal} is not an open cell of the maze")
+        return goals
+
+    def reconstruct_path(
+        self, parents: Sequence[int], goal_cell: int | None = None
+    ) -> list[Position]:
+        """Return a permissible solution by walking parent directions from goal.
+
+        'parents' holds, for every reached cell, the direction of the move
+        that reached it. 'goal_cell' selects the reached goal, the maze end by
+        default.
+        """
+        offsets = [0] + [offset for _, offset, _, _ in self.steps]
+        cell = self.goal_cell if goal_cell is None else goal_cell
+        path = [self.position(cell)]
+        while cell != self.initial_cell:
+            cell -= offsets[parents[cell]]
+            position = self.position(cell)
+            self.grid.path(position)
+            path.append(position)
         return path[::-1]
 
 
+@dataclass
+class GoalIndex:
+    """Uniform bucket grid over goal positions for nearest-goal queries."""
+
+    goals: tuple[Position, ...]
+    bucket_size: int = field(init=False)
+    buckets: dict[tuple[int, int], list[Position]] = field(init=False, repr=False)
+    bounds: tuple[int, int, int, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Sort goals into buckets holding about one goal each."""
+        if not self.goals:
+            raise ValueError("at least one goal is needed")
+        columns = [goal.column for goal in self.goals]
+        rows = [goal.row for goal in self.goals]
+        area = (max(columns) - min(columns) + 1) * (max(rows) - min(rows) + 1)
+        self.bucket_size = max(1, math.isqrt(area // len(self.goals)))
+        self.buckets = {}
+        for goal in self.goals:
+            self.buckets.setdefault(self._bucket(goal.column, goal.row), []).append(goal)
+        self.bounds = (
+            min(column for column, _ in self.buckets),
+            min(row for _, row in self.buckets),
+            max(column for column, _ in self.buckets),
+            max(row for _, row in self.buckets),
+        )
+
+    def _bucket(self, column: int, row: int) -> tuple[int, int]:
+        """Return the bucket holding a coordinate."""
+        return column // self.bucket_size, row // self.bucket_size
+
+    def nearest(
+        self, column: int, row: int, distance: Callable[[int, int], float]
+    ) -> float:
+        """Return the distance to the nearest goal.
+
+        Buckets are scanned in rings around the query until no unseen goal
+        can be closer than the best one found. 'distance' must not decrease
+        when either coordinate difference grows.
+        """
+        bucket_column, bucket_row = self._bucket(column, row)
+        low_column, low_row, high_column, high_row = self.bounds
+        last_ring = max(
+            bucket_column - low_column,
+            high_column - bucket_column,
+            bucket_row - low_row,
+            high_row - bucket_row,
+        )
+        best = math.inf
+        for ring in range(last_ring + 1):
+            if ring and distance((ring - 1) * self.bucket_size + 1, 0) >= best:
+                break
+            for dx in range(-ring, ring + 1):
+                for dy in range(-ring, ring + 1):
+                    if max(abs(dx), abs(dy)) != ring:
+                        continue
+                    for goal in self.buckets.get(
+                        (bucket_column + dx, bucket_row + dy), ()
+                    ):
+                        best = min(
+                            best, distance(abs(goal.column - column), abs(goal.row - row))
+                        )
+        return best
+
+
+@dataclass
+class MultiGoalMazeProblem(MazeProblem):
+    """Maze problem solved by reaching any of several goals."""
+
+    goals: tuple[Position, ...] = ()
+    goal_index: GoalIndex = field(init=False, repr=False)
+
+    _GOAL_FIELDS = ("initial", "goal", "goals")
+
+    def index_goals(self):
+        """Compute the cell ids of the start and index every goal."""
+        if not self.goals:
+            self.goals = (self.goal,)
+        super().index_goals()
+        self.goal_cells = frozenset(self.cell(goal) for goal in self.goals)
+        self.goal_index = GoalIndex(self.goals)
+
+    def is_goal(self, state):
+        """Returns True if state is the position of any maze end."""
+        return state in self.goals
+
+    def heuristic(self, method: str) -> Callable[[int], float]:
+        """Return the heuristic to the nearest goal as a function of cell ids."""
+        distance = self.distance(method)
+        stride, padding = self.stride, self.padding
+        nearest = self.goal_index.nearest
+
+        def estimate(cell: int) -> float:
+            """Estimate the cost of reaching the nearest goal from a cell."""
+            row, column = divmod(cell, stride)
+            return nearest(column - padding, row - padding, distance)
+
+        return estimate
+
+
 def load_problem(
     file_path: str,
+    neighborhood: Neighborhood = FOUR_CONNECTED,
 ) -> MazeProblem:
-    """Reads and parses file at 'path' and returns a maze problem."""
+    """Reads and parses file at 'path' and returns a maze problem.
+
+    A file with several 'end' lines gives a multi-goal maze problem.
+    """
 
     with open(file_path, encoding="utf-8") as file:
         text = file.read()
 
     lines = text.strip().splitlines()
 
+    end_matches = []
+    while lines and (end_match := re.match(r"^end\D+(\d+)\D+(\d+)$", lines[-1])):
+        end_matches.append(end_match)
+        lines.pop()
+    start_match = re.match(r"^start\D+(\d+)\D+(\d+)$", lines[-1]) if lines else None
+
+    if not start_match or not end_matches:
+        raise ValueError("file input needs to end with start and end coordinates")
+
     data = [
         [Cell.WALL if char == "X" else Cell.EMPTY for char in line.strip()]
-        for line in lines[:-2]
+        for line in lines[:-1]
     ]
 
-    start_match = re.match(r"^start\D+(\d+)\D+(\d+)$", lines[-2])
-    end_match = re.match(r"^end\D+(\d+)\D+(\d+)$", lines[-1])
-
-    if not start_match or not end_match:
-        raise ValueError("file input needs to end with start and end coordinates")
-
     start = Position(column=int(start_match.group(1)), row=int(start_match.group(2)))
-    end = Position(column=int(end_match.group(1)), row=int(end_match.group(2)))
+    ends = [
+        Position(column=int(end_match.group(1)), row=int(end_match.group(2)))
+        for end_match in reversed(end_matches)
+    ]
 
     data[start.row][start.column] = Cell.START
-    data[end.row][end.column] = Cell.END
+    for end in ends:
+        data[end.row][end.column] = Cell.END
 
-    return MazeProblem(start, end, Grid(data))
+    if len(ends) > 1:
+        return MultiGoalMazeProblem(start, ends[0], Grid(data), neighborhood, tuple(ends))
+    return MazeProblem(start, ends[0], Grid(data), neighborhood)
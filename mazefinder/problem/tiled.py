@@ -0,0 +1,267 @@
+"""Support for mazes stored as memory-mapped tiles on disk.
+
+A tiled maze file starts with a header holding the maze shape, tile size and
+start and end coordinates, followed by square tiles in row-major order. Each
+tile stores one byte per cell, 1 for walls and 0 for open cells; cells of edge
+tiles outside the maze are walls.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import mmap
+import re
+import struct
+from typing import Iterable
+from .problem import (
+    FOUR_CONNECTED,
+    Grid,
+    MazeProblem,
+    MultiGoalMazeProblem,
+    Neighborhood,
+    Position,
+)
+
+HEADER = struct.Struct("<4s7I")  # magic, width, height, tile size, start, end
+MAGIC = b"MZTG"
+TILE_SIZE_DEFAULT = 64
+TILE_CACHE_DEFAULT = 1024  # tiles kept in memory
+
+WALL_TABLE = bytes(1 if byte == ord("X") else 0 for byte in range(256))
+
+
+@dataclass
+class TiledGrid:
+    """Read-only view of a tiled maze file with an LRU cache of tiles."""
+
+    path: str
+    cache_tiles: int = TILE_CACHE_DEFAULT
+
+    width: int = field(init=False)
+    height: int = field(init=False)
+    tile_size: int = field(init=False)
+    start: Position = field(init=False)
+    end: Position = field(init=False)
+    tiles_across: int = field(init=False, repr=False)
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _map: mmap.mmap = field(init=False, repr=False)
+    _cache: OrderedDict[int, bytes] = field(init=False, repr=False)
+    _last: tuple[int, bytes] = field(default=(-1, b""), init=False, repr=False)
+
+    def __post_init__(self):
+        """Map the file and read its header."""
+        if self.cache_tiles < 1:
+            raise ValueError("the tile cache needs room for at least one tile")
+        with open(self.path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.width, self.height, self.tile_size, *coordinates = HEADER.unpack(
+            self._map[: HEADER.size]
+        )
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a tiled maze file")
+        self.start = Position(coordinates[0], coordinates[1])
+        self.end = Position(coordinates[2], coordinates[3])
+        self.tiles_across = -(-self.width // self.tile_size)
+        self._cache = OrderedDict()
+
+    def tile(self, index: int) -> bytes:
+        """Return a tile, faulting it in from the file when not cached."""
+        last_index, tile = self._last
+        if index == last_index:
+            self.hits += 1
+            return tile
+        tile = self._cache.get(index)
+        if tile is not None:
+            self.hits += 1
+            self._cache.move_to_end(index)
+        else:
+            self.misses += 1
+            area = self.tile_size * self.tile_size
+            start = HEADER.size + index * area
+            tile = self._map[start : start + area]
+            self._cache[index] = tile
+            if len(self._cache) > self.cache_tiles:
+                self._cache.popitem(last=False)
+        self._last = index, tile
+        return tile
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of tile lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset_stats(self):
+        """Reset the cache hit and miss counters."""
+        self.hits = self.misses = 0
+
+    def __getstate__(self) -> dict:
+        """Pickle only the file path, e.g. for worker processes."""
+        return {"path": self.path, "cache_tiles": self.cache_tiles}
+
+    def __setstate__(self, state: dict):
+        """Reopen the file when unpickled."""
+        self.__init__(state["path"], state["cache_tiles"])
+
+    def close(self):
+        """Drop cached tiles and unmap the file."""
+        self._cache.clear()
+        self._last = -1, b""
+        self._map.close()
+
+
+@dataclass
+class TiledWalls:
+    """Wall lookup by MazeProblem cell id backed by a tiled grid."""
+
+    tiles: TiledGrid
+    stride: int
+    padding: int
+
+    def __getitem__(self, cell: int) -> int:
+        """Return 1 if the cell is a wall, 0 otherwise."""
+        tiles = self.tiles
+        row, column = divmod(cell, self.stride)
+        row -= self.padding
+        column -= self.padding
+        if not (0 <= column < tiles.width and 0 <= row < tiles.height):
+            return 1
+        size = tiles.tile_size
+        tile = tiles.tile((row // size) * tiles.tiles_across + column // size)
+        return tile[(row % size) * size + column % size]
+
+    def __len__(self) -> int:
+        return self.stride * (self.tiles.height + 2 * self.padding)
+
+
+@dataclass
+class NullGrid(Grid):
+    """Grid stand-in that records nothing, for mazes too large to draw."""
+
+    data: list = field(default_factory=list)
+
+    def visit(self, position: Position) -> None:
+        """Ignore visited cells."""
+
+    def path(self, position: Position) -> None:
+        """Ignore path cells."""
+
+
+@dataclass
+class TiledMazeProblem(MazeProblem):
+    """Maze problem reading its walls from a tiled grid on demand."""
+
+    tiles: TiledGrid | None = field(default=None, repr=False)
+
+    def __post_init__(self):
+        """Index cells for the tiled grid shape and attach its walls."""
+        self.height, self.width = self.tiles.height, self.tiles.width
+        self.index_cells()
+        self.walls = TiledWalls(self.tiles, self.stride, self.padding)
+
+    def start_search(self) -> None:
+        """Count tile cache hits of each search separately."""
+        self.tiles.reset_stats()
+
+    def with_goals(self, goals: Iterable[Position]) -> "TiledMultiGoalMazeProblem":
+        """Return the same tiled maze solved by reaching any of 'goals'."""
+        goals = self.check_goals(goals)
+        return TiledMultiGoalMazeProblem(
+            self.initial,
+            goals[0],
+            NullGrid(),
+            self.neighborhood,
+            goals=goals,
+            tiles=self.tiles,
+        )
+
+
+@dataclass
+class TiledMultiGoalMazeProblem(TiledMazeProblem, MultiGoalMazeProblem):
+    """Tiled maze problem solved by reaching any of several goals."""
+
+
+def write_tiled(
+    file_path: str,
+    rows: Iterable[bytes],
+    width: int,
+    height: int,
+    start: Position,
+    end: Position,
+    tile_size: int = TILE_SIZE_DEFAULT,
+):
+    """Write rows of wall bytes (1 for walls) into a tiled maze file."""
+    tiles_across = -(-width // tile_size)
+    padded_width = tiles_across * tile_size
+    wall_row = b"\x01" * padded_width
+    written = 0
+
+    with open(file_path, "wb") as file:
+        file.write(
+            HEADER.pack(
+                MAGIC, width, height, tile_size, start.column, start.row, end.column, end.row
+            )
+        )
+
+        def write_band(band: list[bytes]):
+            """Write one row of tiles."""
+            band += [wall_row] * (tile_size - len(band))
+            for tile_column in range(tiles_across):
+                offset = tile_column * tile_size
+                file.write(b"".join(row[offset : offset + tile_size] for row in band))
+
+        band: list[bytes] = []
+        for row in rows:
+            band.append(row[:width].ljust(padded_width, b"\x01"))
+            written += 1
+            if len(band) == tile_size:
+                write_band(band)
+                band = []
+        if band:
+            write_band(band)
+
+    if written != height:
+        raise ValueError(f"expected {height} rows, got {written}")
+
+
+def convert_maze(
+    text_path: str, tiled_path: str, tile_size: int = TILE_SIZE_DEFAULT
+):
+    """Convert a text maze file into a tiled maze file, streaming its rows."""
+    width = height = 0
+    tail: list[str] = []
+    with open(text_path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            tail.append(line)
+            if len(tail) > 2:
+                width = max(width, len(tail.pop(0)))
+                height += 1
+
+    start_match = re.match(r"^start\D+(\d+)\D+(\d+)$", tail[0]) if tail else None
+    end_match = re.match(r"^end\D+(\d+)\D+(\d+)$", tail[-1]) if tail else None
+    if not start_match or not end_match:
+        raise ValueError("file input needs to end with start and end coordinates")
+    start = Position(column=int(start_match.group(1)), row=int(start_match.group(2)))
+    end = Position(column=int(end_match.group(1)), row=int(end_match.group(2)))
+
+    def rows():
+        """Yield wall bytes of every grid row."""
+        with open(text_path, encoding="utf-8") as file:
+            lines = (line.strip() for line in file)
+            for _, line in zip(range(height), (line for line in lines if line)):
+                yield line.encode("ascii").translate(WALL_TABLE)
+
+    write_tiled(tiled_path, rows(), width, height, start, end, tile_size)
+
+
+def load_tiled_problem(
+    file_path: str,
+    neighborhood: Neighborhood = FOUR_CONNECTED,
+    cache_tiles: int = TILE_CACHE_DEFAULT,
+) -> TiledMazeProblem:
+    """Open a tiled maze file as a maze problem."""
+    tiles = TiledGrid(file_path, cache_tiles)
+    return TiledMazeProblem(tiles.start, tiles.end, NullGrid(), neighborhood, tiles)
@@ -1,9 +1,112 @@
-"""Make modules contents available."""
-
-from .data_structures import *
-from .bfs import *
-from .dfs import *
-from .dijkstra import *
-from .greedy import *
-from .a_star import *
-from .random_search import *
+"""Make modules contents available.
+
+Modules are imported lazily on first attribute access, so importing the
+package does not pay for algorithms that are never used. Modules named like
+the function they export are private. Their public names (e.g. 'a_star')
+remain as compatibility modules, which never replace the same-named function
+on the package when imported.
+"""
+
+from importlib import import_module
+import sys
+from types import ModuleType
+
+# algorithm name -> module, for strategies taking (problem, animator)
+ALGORITHMS = {
+    "bfs": "_bfs",
+    "recursive_dfs": "dfs",
+    "stack_dfs": "dfs",
+    "iterator_dfs": "dfs",
+    "dijkstra": "_dijkstra",
+    "greedy_manhattan": "_greedy",
+    "greedy_euclidean": "_greedy",
+    "greedy_octile": "_greedy",
+    "greedy_chebyshev": "_greedy",
+    "a_star_manhattan": "_a_star",
+    "a_star_euclidean": "_a_star",
+    "a_star_octile": "_a_star",
+    "a_star_chebyshev": "_a_star",
+    "a_star_overweight_manhattan": "_a_star",
+    "a_star_overweight_euclidean": "_a_star",
+    "ara_star_manhattan": "_ara_star",
+    "ara_star_euclidean": "_ara_star",
+    "ara_star_octile": "_ara_star",
+    "random_search": "_random_search",
+}
+
+# public name -> module defining it
+_EXPORTS = {
+    **ALGORITHMS,
+    "DistanceItem": "data_structures",
+    "Heap": "data_structures",
+    "Queue": "data_structures",
+    "Stack": "data_structures",
+    "RandomList": "data_structures",
+    "CellSet": "memory",
+    "SearchMemory": "memory",
+    "search_memory": "memory",
+    "ExpansionBatch": "stream",
+    "SearchStream": "stream",
+    "interleave": "stream",
+    "run_steps": "stream",
+    "bfs_steps": "_bfs",
+    "dijkstra_steps": "_dijkstra",
+    "greedy": "_greedy",
+    "greedy_steps": "_greedy",
+    "a_star": "_a_star",
+    "a_star_steps": "_a_star",
+    "AnytimeResult": "_ara_star",
+    "ara_star": "_ara_star",
+    "ara_star_search": "_ara_star",
+    "all_goals": "multi_goal",
+    "all_goals_steps": "multi_goal",
+    "nearest_goal": "multi_goal",
+    "BatchReport": "batch",
+    "GoalDistances": "batch",
+    "ReservationTable": "batch",
+    "plan_batch": "batch",
+    "plan_independent": "batch",
+    "plan_cooperative": "batch",
+    "reversed_problem": "batch",
+}
+
+__all__ = [*_EXPORTS, "ALGORITHMS", "load_algorithm"]
+
+
+def _load(name: str):
+    """Import the module defining 'name' and return the named object."""
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def load_algorithm(name: str):
+    """Import and return the search strategy called 'name'."""
+    if name not in ALGORITHMS:
+        raise ValueError(f"unknown algorithm '{name}', choose one of {', '.join(ALGORITHMS)}")
+    return _load(name)
+
+
+def __getattr__(name: str):
+    """Import the module defining 'name' on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load(name)
+
+
+def __dir__():
+    """List the lazily available names."""
+    return sorted(__all__)
+
+
+class _SearchPackage(ModuleType):
+    """Package module keeping exports bound over submodules of the same name."""
+
+    def __setattr__(self, name: str, value):
+        """Skip binding a submodule over the export it is named after."""
+        if isinstance(value, ModuleType) and name in _EXPORTS:
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _SearchPackage
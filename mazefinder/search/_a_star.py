@@ -0,0 +1,99 @@
+"""Support for A* state space search algorithms."""
+
+from mazefinder.animate import Animator
+from mazefinder.problem import MazeProblem, Position
+from .data_structures import Heap
+from .memory import search_memory
+from .stream import BATCH_SIZE, ExpansionBatch, SearchSteps, run_steps
+
+
+def a_star_steps(
+    problem: MazeProblem,
+    method: str = "manhattan",
+    weight: float = 1,
+    batch_size: int = BATCH_SIZE,
+) -> SearchSteps:
+    """Stream A* algorithm progress in batches of expansions."""
+    heuristic = problem.heuristic(method)
+    with search_memory(problem) as memory:
+        heap: Heap[int] = Heap([(0, problem.initial_cell)])
+        visited, distances, parents = memory.visited, memory.distances, memory.parents
+        visited.add(problem.initial_cell)
+        distances[problem.initial_cell] = 0
+        batch: list[int] = []
+        expanded = 0
+
+        while heap:
+            _, current = heap.pop()
+            if current in problem.goal_cells:
+                yield ExpansionBatch(batch, len(heap), final=True)
+                return problem.reconstruct_path(parents, current), len(visited)
+            distance = distances[current]
+            for direction, cost, neighbor in problem.neighbors_weighted(current):
+                total = distance + cost
+                if neighbor not in visited or total < distances[neighbor]:
+                    if neighbor not in visited:
+                        batch.append(neighbor)
+                    visited.add(neighbor)
+                    distances[neighbor] = total
+                    parents[neighbor] = direction
+                    heap.push(total + heuristic(neighbor) * weight, neighbor)
+            expanded += 1
+            if expanded % batch_size == 0:
+                yield ExpansionBatch(batch, len(heap))
+                batch = []
+
+        yield ExpansionBatch(batch, 0, final=True)
+        return None, len(visited)
+
+
+def a_star(
+    problem: MazeProblem,
+    animator: Animator,
+    method: str = "manhattan",
+    weight: float = 1,
+) -> tuple[list[Position] | None, int]:
+    """Search through the state space using A* algorithm."""
+    return run_steps(a_star_steps(problem, method, weight), problem, animator)
+
+
+def a_star_manhattan(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """A* algorithm using manhattan distance."""
+    return a_star(problem, animator, method="manhattan")
+
+
+def a_star_euclidean(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """A* algorithm using euclidean distance."""
+    return a_star(problem, animator, method="euclidean")
+
+
+def a_star_octile(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """A* algorithm using octile distance."""
+    return a_star(problem, animator, method="octile")
+
+
+def a_star_chebyshev(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """A* algorithm using chebyshev distance."""
+    return a_star(problem, animator, method="chebyshev")
+
+
+def a_star_overweight_manhattan(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """A* algorithm with an overweight manhattan heurestic."""
+    return a_star(problem, animator, method="manhattan", weight=1.5)
+
+
+def a_star_overweight_euclidean(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """A* algorithm with an overweight euclidean heurestic."""
+    return a_star(problem, animator, method="euclidean", weight=1.5)
@@ -0,0 +1,199 @@
+"""Support for the anytime repairing A* (ARA*) state space search algorithm."""
+
+from dataclasses import dataclass
+from math import inf
+from time import perf_counter
+from typing import Generator
+from mazefinder.animate import Animator
+from mazefinder.problem import MazeProblem, Position
+from .data_structures import Heap
+from .memory import search_memory
+
+ARA_INITIAL_WEIGHT = 2.5
+ARA_WEIGHT_STEP = 0.5
+ARA_TIME_BUDGET = 1.0
+
+
+@dataclass
+class AnytimeResult:
+    """A solution found by an anytime search."""
+
+    path: list[Position]
+    bound: float  # the path costs at most bound times the optimal cost
+    elapsed: float  # seconds since the search started
+    nodes_visited: int
+
+
+def ara_star(
+    problem: MazeProblem,
+    animator: Animator,
+    method: str = "manhattan",
+    initial_weight: float = ARA_INITIAL_WEIGHT,
+    weight_step: float = ARA_WEIGHT_STEP,
+    time_budget: float = inf,
+) -> Generator[AnytimeResult, None, int]:
+    """Yield improving solutions using anytime repairing A*.
+
+    The first solution is always searched for to completion. Every following
+    iteration lowers the heuristic weight by 'weight_step' and reuses the open
+    and closed lists, stopping once the budget runs out or the solution is
+    proven optimal. Iterations that improve neither the path nor its bound
+    yield nothing. The number of visited nodes is returned when it stops.
+    Only the maze end is searched for, even in multi-goal problems.
+    """
+    if initial_weight < 1:
+        raise ValueError("the initial weight must be at least 1")
+    if weight_step <= 0:
+        raise ValueError("the weight step must be positive")
+    return _repair_search(
+        problem, animator, method, initial_weight, weight_step, time_budget
+    )
+
+
+def _repair_search(
+    problem: MazeProblem,
+    animator: Animator,
+    method: str,
+    weight: float,
+    weight_step: float,
+    time_budget: float,
+) -> Generator[AnytimeResult, None, int]:
+    """Run the anytime repairing A* iterations of 'ara_star'."""
+    started = perf_counter()
+    deadline = started + time_budget
+    heuristic = problem.heuristic(method)
+    goal = problem.goal_cell
+
+    with search_memory(problem) as memory:
+        visited, distances, parents = memory.visited, memory.distances, memory.parents
+        visited.add(problem.initial_cell)
+        distances[problem.initial_cell] = 0
+
+        # the open set maps cells to their current key, stale heap items are skipped
+        opened: dict[int, float] = {}
+        closed = memory.closed
+        inconsistent: set[int] = set()
+        heap: Heap[int] = Heap()
+
+        def open_cell(cell: int):
+            """Insert a cell into the open set under the current weight."""
+            key = distances[cell] + weight * heuristic(cell)
+            opened[cell] = key
+            heap.push(key, cell)
+
+        def goal_distance() -> float:
+            """Return the cost of the best known path to goal."""
+            return distances[goal] if goal in visited else inf
+
+        def min_key() -> float:
+            """Return the lowest key in the open set."""
+            while heap:
+                key, cell = heap.peek()
+                if opened.get(cell) == key:
+                    return key
+                heap.pop()
+            return inf
+
+        def improve_path(limit: float) -> bool:
+            """Expand cells until the goal key is lowest, return False on timeout."""
+            while goal_distance() > min_key():
+                if perf_counter() > limit:
+                    return False
+                _, current = heap.pop()
+                del opened[current]
+                closed.add(current)
+                distance = distances[current]
+                for direction, cost, neighbor in problem.neighbors_weighted(current):
+                    total = distance + cost
+                    if neighbor not in visited or total < distances[neighbor]:
+                        visited.add(neighbor)
+                        distances[neighbor] = total
+                        parents[neighbor] = direction
+                        problem.visit(neighbor)
+                        animator.next_frame(problem.grid)
+                        if neighbor in closed:
+                            inconsistent.add(neighbor)
+                        else:
+                            open_cell(neighbor)
+            return True
+
+        def suboptimality() -> float:
+            """Return the proven bound on the cost of the current solution."""
+            lowest = min(
+                (distances[cell] + heuristic(cell) for cell in (*opened, *inconsistent)),
+                default=inf,
+            )
+            if lowest in (0, inf):
+                return 1.0
+            return max(1.0, min(weight, distances[goal] / lowest))
+
+        open_cell(problem.initial_cell)
+        improve_path(inf)
+        if goal not in visited:
+            return len(visited)
+        bound, cost = suboptimality(), distances[goal]
+        yield AnytimeResult(
+            problem.reconstruct_path(parents),
+            bound,
+            perf_counter() - started,
+            len(visited),
+        )
+
+        while bound > 1 and perf_counter() < deadline:
+            weight = max(1.0, weight - weight_step)
+            opened.update(dict.fromkeys(inconsistent, 0))
+            inconsistent.clear()
+            closed.clear()
+            heap = Heap()
+            for cell in list(opened):
+                open_cell(cell)
+            if not improve_path(deadline):
+                return len(visited)
+            previous_bound, previous_cost = bound, cost
+            bound, cost = suboptimality(), distances[goal]
+            if bound >= previous_bound and cost >= previous_cost:
+                continue
+            yield AnytimeResult(
+                problem.reconstruct_path(parents),
+                bound,
+                perf_counter() - started,
+                len(visited),
+            )
+        return len(visited)
+
+
+def ara_star_search(
+    problem: MazeProblem,
+    animator: Animator,
+    method: str = "manhattan",
+    time_budget: float = ARA_TIME_BUDGET,
+) -> tuple[list[Position] | None, int]:
+    """Return the best solution found by ARA* within the time budget."""
+    results = ara_star(problem, animator, method, time_budget=time_budget)
+    path = None
+    while True:
+        try:
+            path = next(results).path
+        except StopIteration as stop:
+            return path, stop.value
+
+
+def ara_star_manhattan(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """ARA* algorithm using manhattan distance."""
+    return ara_star_search(problem, animator, method="manhattan")
+
+
+def ara_star_euclidean(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """ARA* algorithm using euclidean distance."""
+    return ara_star_search(problem, animator, method="euclidean")
+
+
+def ara_star_octile(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """ARA* algorithm using octile distance."""
+    return ara_star_search(problem, animator, method="octile")
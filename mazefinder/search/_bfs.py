@@ -0,0 +1,42 @@
+"""Support for a breadth-first state space search algorithms."""
+
+from mazefinder.problem import Position, MazeProblem
+from mazefinder.animate import Animator
+from .data_structures import Queue
+from .memory import search_memory
+from .stream import BATCH_SIZE, ExpansionBatch, SearchSteps, run_steps
+
+
+def bfs_steps(problem: MazeProblem, batch_size: int = BATCH_SIZE) -> SearchSteps:
+    """Stream Breadth-First Search progress in batches of expansions."""
+    with search_memory(problem) as memory:
+        queue: Queue[int] = Queue([problem.initial_cell])
+        parents = memory.parents
+        visited = memory.visited  # open and closed set union
+        visited.add(problem.initial_cell)
+        batch: list[int] = []
+        expanded = 0
+
+        while queue:
+            current = queue.pop()
+            if current in problem.goal_cells:
+                yield ExpansionBatch(batch, len(queue), final=True)
+                return problem.reconstruct_path(parents, current), len(visited)
+            for direction, neighbor in problem.neighbors(current):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    batch.append(neighbor)
+                    queue.push(neighbor)
+                    parents[neighbor] = direction
+            expanded += 1
+            if expanded % batch_size == 0:
+                yield ExpansionBatch(batch, len(queue))
+                batch = []
+
+        yield ExpansionBatch(batch, 0, final=True)
+        return None, len(visited)
+
+
+def bfs(problem: MazeProblem, animator: Animator) -> tuple[list[Position] | None, int]:
+    """Search through the state space using Breadth-First Search."""
+    return run_steps(bfs_steps(problem), problem, animator)
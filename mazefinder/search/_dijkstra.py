@@ -0,0 +1,47 @@
+"""Support for a Dijkstra state space search algorithm."""
+
+from mazefinder.animate import Animator
+from mazefinder.problem import MazeProblem, Position
+from .data_structures import Heap
+from .memory import search_memory
+from .stream import BATCH_SIZE, ExpansionBatch, SearchSteps, run_steps
+
+
+def dijkstra_steps(problem: MazeProblem, batch_size: int = BATCH_SIZE) -> SearchSteps:
+    """Stream Dijkstra's algorithm progress in batches of expansions."""
+    with search_memory(problem) as memory:
+        heap: Heap[int] = Heap([(0, problem.initial_cell)])
+        visited, distances, parents = memory.visited, memory.distances, memory.parents
+        visited.add(problem.initial_cell)
+        distances[problem.initial_cell] = 0
+        batch: list[int] = []
+        expanded = 0
+
+        while heap:
+            distance, current = heap.pop()
+            if current in problem.goal_cells:
+                yield ExpansionBatch(batch, len(heap), final=True)
+                return problem.reconstruct_path(parents, current), len(visited)
+            for direction, weight, neighbor in problem.neighbors_weighted(current):
+                total = distance + weight
+                if neighbor not in visited or total < distances[neighbor]:
+                    if neighbor not in visited:
+                        batch.append(neighbor)
+                    visited.add(neighbor)
+                    distances[neighbor] = total
+                    parents[neighbor] = direction
+                    heap.push(total, neighbor)
+            expanded += 1
+            if expanded % batch_size == 0:
+                yield ExpansionBatch(batch, len(heap))
+                batch = []
+
+        yield ExpansionBatch(batch, 0, final=True)
+        return None, len(visited)
+
+
+def dijkstra(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """Search through the state space using Dijskstra's algorithm."""
+    return run_steps(dijkstra_steps(problem), problem, animator)
@@ -0,0 +1,75 @@
+"""Support for a greedy state space search algorithm."""
+
+from mazefinder.animate import Animator
+from mazefinder.problem import MazeProblem, Position
+from .data_structures import Heap
+from .memory import search_memory
+from .stream import BATCH_SIZE, ExpansionBatch, SearchSteps, run_steps
+
+
+def greedy_steps(
+    problem: MazeProblem, method: str = "manhattan", batch_size: int = BATCH_SIZE
+) -> SearchSteps:
+    """Stream Greedy algorithm progress in batches of expansions."""
+    heuristic = problem.heuristic(method)
+    with search_memory(problem) as memory:
+        heap: Heap[int] = Heap([(0, problem.initial_cell)])
+        visited = memory.visited
+        visited.add(problem.initial_cell)
+        parents = memory.parents
+        batch: list[int] = []
+        expanded = 0
+
+        while heap:
+            _, current = heap.pop()
+            if current in problem.goal_cells:
+                yield ExpansionBatch(batch, len(heap), final=True)
+                return problem.reconstruct_path(parents, current), len(visited)
+            for direction, neighbor in problem.neighbors(current):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    batch.append(neighbor)
+                    parents[neighbor] = direction
+                    heap.push(heuristic(neighbor), neighbor)
+            expanded += 1
+            if expanded % batch_size == 0:
+                yield ExpansionBatch(batch, len(heap))
+                batch = []
+
+        yield ExpansionBatch(batch, 0, final=True)
+        return None, len(visited)
+
+
+def greedy(
+    problem: MazeProblem, animator: Animator, method: str = "manhattan"
+) -> tuple[list[Position] | None, int]:
+    """Search through the state space using a Greedy algorithm."""
+    return run_steps(greedy_steps(problem, method), problem, animator)
+
+
+def greedy_manhattan(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """Greedy algorithm using manhattan distance."""
+    return greedy(problem, animator, method="manhattan")
+
+
+def greedy_euclidean(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """Greedy algorithm using euclidean distance."""
+    return greedy(problem, animator, method="euclidean")
+
+
+def greedy_octile(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """Greedy algorithm using octile distance."""
+    return greedy(problem, animator, method="octile")
+
+
+def greedy_chebyshev(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """Greedy algorithm using chebyshev distance."""
+    return greedy(problem, animator, method="chebyshev")
@@ -0,0 +1,32 @@
+"""Support for a random-first state space search algorithm."""
+
+from mazefinder.problem import MazeProblem, Position
+from mazefinder.animate import Animator
+from .data_structures import RandomList
+from .memory import search_memory
+
+
+def random_search(
+    problem: MazeProblem, animator: Animator
+) -> tuple[list[Position] | None, int]:
+    """Search through state space using Random-first Search."""
+    with search_memory(problem) as memory:
+        random_list: RandomList[int] = RandomList([problem.initial_cell])
+        parents = memory.parents
+        visited = memory.visited
+        visited.add(problem.initial_cell)
+
+        while random_list:
+            current = random_list.pop()
+            if current in problem.goal_cells:
+                return problem.reconstruct_path(parents, current), len(visited)
+
+            for direction, neighbor in problem.neighbors(current):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    problem.visit(neighbor)
+                    animator.next_frame(problem.grid)
+                    random_list.push(neighbor)
+                    parents[neighbor] = direction
+
+        return None, len(visited)
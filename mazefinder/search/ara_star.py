@@ -0,0 +1,3 @@
+"""Compatibility import path, the algorithm lives in the private _ara_star module."""
+
+from ._ara_star import *
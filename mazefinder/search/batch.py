@@ -0,0 +1,324 @@
+"""Support for planning paths of many agents on a shared maze."""
+
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from dataclasses import dataclass, field
+import math
+from time import perf_counter
+from typing import Sequence
+from mazefinder.problem import MazeProblem, Neighborhood, NullGrid, Position
+from .data_structures import Heap
+from .multi_goal import all_goals_steps
+
+Query = tuple[Position, Position]  # (start, goal) of one agent
+
+COOPERATIVE_HORIZON_FACTOR = 2  # timesteps allowed per move of the free path
+COOPERATIVE_HORIZON_SLACK = 16
+
+
+@dataclass
+class BatchReport:
+    """Paths planned for a batch of agents, in query order."""
+
+    paths: list[list[Position] | None]
+    nodes_visited: int
+    trees: int  # shortest-path trees built for the batch
+    elapsed: float
+
+    @property
+    def agents_per_second(self) -> float:
+        """Return the planning throughput."""
+        return len(self.paths) / self.elapsed if self.elapsed else float("inf")
+
+
+def reversed_problem(problem: MazeProblem) -> MazeProblem:
+    """Return the maze with every move reversed, sharing its wall table.
+
+    A shortest-path tree grown from a goal in the reversed maze holds the
+    shortest paths from every cell to that goal.
+    """
+    neighborhood = problem.neighborhood
+    reverse = copy(problem)
+    reverse.neighborhood = Neighborhood(
+        tuple(Position(-move.column, -move.row) for move in neighborhood.moves),
+        neighborhood.costs,
+        neighborhood.corner_cutting,
+    )
+    return reverse
+
+
+def _tree_problem(
+    problem: MazeProblem, root: Position, targets: Sequence[Position]
+) -> MazeProblem:
+    """Return a copy of the maze searched from 'root' until 'targets' settle."""
+    tree = copy(problem)
+    tree.initial, tree.goal = root, targets[0]
+    tree.goal_cells = frozenset(tree.cell(target) for target in targets)
+    return tree
+
+
+def _grow_tree(
+    problem: MazeProblem, root: Position, targets: Sequence[Position]
+) -> tuple[dict[Position, list[Position] | None], int]:
+    """Return shortest paths from root to every target and nodes visited."""
+    steps = all_goals_steps(_tree_problem(problem, root, targets))
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+_worker_problems: tuple[MazeProblem, MazeProblem] | None = None
+
+
+def _init_worker(forward: MazeProblem, reverse: MazeProblem):
+    """Keep the shared mazes of a worker process."""
+    global _worker_problems
+    _worker_problems = forward, reverse
+
+
+def _grow_worker_tree(
+    root: Position, targets: Sequence[Position], from_goal: bool
+) -> tuple[dict[Position, list[Position] | None], int]:
+    """Grow one tree in a worker process."""
+    forward, reverse = _worker_problems
+    return _grow_tree(reverse if from_goal else forward, root, targets)
+
+
+def plan_independent(
+    problem: MazeProblem, queries: Sequence[Query], workers: int = 1
+) -> BatchReport:
+    """Plan shortest paths for many agents, ignoring each other.
+
+    Queries are grouped by goal, or by start when there are fewer distinct
+    starts, so one shortest-path tree serves every agent of a group. Trees
+    grown from a goal use the reversed maze. With more than one worker the
+    groups are planned in parallel processes.
+    """
+    started = perf_counter()
+    forward = copy(problem)
+    forward.grid = NullGrid()
+    reverse = reversed_problem(forward)
+
+    from_goal = len({goal for _, goal in queries}) <= len({start for start, _ in queries})
+    groups: dict[Position, list[Position]] = {}
+    for start, goal in queries:
+        root, target = (goal, start) if from_goal else (start, goal)
+        groups.setdefault(root, []).append(target)
+    groups = {root: list(dict.fromkeys(targets)) for root, targets in groups.items()}
+
+    if workers > 1 and len(groups) > 1:
+        with ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(forward, reverse)
+        ) as executor:
+            results = list(
+                executor.map(
+                    _grow_worker_tree,
+                    groups,
+                    groups.values(),
+                    [from_goal] * len(groups),
+                )
+            )
+    else:
+        tree_problem = reverse if from_goal else forward
+        results = [_grow_tree(tree_problem, root, targets) for root, targets in groups.items()]
+
+    trees = dict(zip(groups, results))
+    paths = []
+    for start, goal in queries:
+        if from_goal:
+            path = trees[goal][0][start]
+            paths.append(path[::-1] if path else None)
+        else:
+            paths.append(trees[start][0][goal])
+
+    return BatchReport(
+        paths,
+        sum(nodes for _, nodes in results),
+        len(groups),
+        perf_counter() - started,
+    )
+
+
+@dataclass
+class ReservationTable:
+    """Space-time reservations of cells and moves by planned agents."""
+
+    cells: set[tuple[int, int]] = field(default_factory=set)  # (cell, time)
+    # (from cell, to cell, departure time)
+    moves: set[tuple[int, int, int]] = field(default_factory=set)
+
+    def free(self, source: int, target: int, time: int) -> bool:
+        """Return whether a move departing at 'time' avoids every reservation."""
+        if (target, time + 1) in self.cells:
+            return False
+        return (target, source, time) not in self.moves
+
+    def claim_start(self, cell: int) -> bool:
+        """Reserve a start cell at time 0, return False if it is taken."""
+        if (cell, 0) in self.cells:
+            return False
+        self.cells.add((cell, 0))
+        return True
+
+    def reserve(self, cells: list[int]):
+        """Reserve a timed path of cells, one per timestep.
+
+        The start at time 0 must already be claimed, every later cell and
+        move must be free.
+        """
+        for time in range(1, len(cells)):
+            if not self.free(cells[time - 1], cells[time], time - 1):
+                raise ValueError(f"timed path collides at time {time}")
+        for time, cell in enumerate(cells):
+            self.cells.add((cell, time))
+            if time:
+                self.moves.add((cells[time - 1], cell, time - 1))
+
+
+class GoalDistances:
+    """Exact costs to a goal from a reverse Dijkstra search resumed on demand."""
+
+    def __init__(self, reverse: MazeProblem, goal: int):
+        """Start the reverse search at the goal."""
+        self.reverse = reverse
+        self.heap: Heap[int] = Heap([(0, goal)])
+        self.distances: dict[int, float] = {goal: 0}
+        self.settled: set[int] = set()
+
+    def __call__(self, cell: int) -> float:
+        """Return the cost from a cell to the goal, inf when unreachable."""
+        heap, distances, settled = self.heap, self.distances, self.settled
+        while cell not in settled and heap:
+            distance, current = heap.pop()
+            if current in settled:
+                continue
+            settled.add(current)
+            for _, weight, neighbor in self.reverse.neighbors_weighted(current):
+                total = distance + weight
+                if total < distances.get(neighbor, float("inf")):
+                    distances[neighbor] = total
+                    heap.push(total, neighbor)
+        return distances[cell] if cell in settled else float("inf")
+
+    @property
+    def nodes_visited(self) -> int:
+        """Return the number of cells the reverse search reached."""
+        return len(self.distances)
+
+
+def _space_time_a_star(
+    problem: MazeProblem,
+    start: int,
+    goal: int,
+    reservations: ReservationTable,
+    horizon: int,
+    heuristic: GoalDistances,
+) -> tuple[list[int] | None, int]:
+    """Return a timed path of cells avoiding reservations and nodes visited.
+
+    Every move and every wait takes one timestep; waiting costs as much as
+    the cheapest straight move.
+    """
+    wait_cost = problem.neighborhood.straight_cost
+    heap: Heap[tuple[int, int]] = Heap([(heuristic(start), (start, 0))])
+    distances: dict[tuple[int, int], float] = {(start, 0): 0}
+    previous: dict[tuple[int, int], tuple[int, int]] = {}
+
+    while heap:
+        estimate, state = heap.pop()
+        cell, time = state
+        distance = distances[state]
+        if estimate > distance + heuristic(cell):
+            continue
+        if cell == goal:
+            path = [cell]
+            while state in previous:
+                state = previous[state]
+                path.append(state[0])
+            return path[::-1], len(distances)
+        if time >= horizon:
+            continue
+        moves = [(wait_cost, cell)]
+        moves += [(cost, neighbor) for _, cost, neighbor in problem.neighbors_weighted(cell)]
+        for cost, neighbor in moves:
+            if not reservations.free(cell, neighbor, time):
+                continue
+            following = (neighbor, time + 1)
+            total = distance + cost
+            if total < distances.get(following, float("inf")):
+                distances[following] = total
+                previous[following] = state
+                heap.push(total + heuristic(neighbor), following)
+
+    return None, len(distances)
+
+
+def plan_cooperative(problem: MazeProblem, queries: Sequence[Query]) -> BatchReport:
+    """Plan collision-free timed paths for agents in query order.
+
+    Every agent runs space-time A* around the reservations of the agents
+    before it, guided by exact costs to its goal from a reverse search shared
+    by agents with the same goal. The cost of the agent's free path bounds
+    its time horizon. Every start is reserved at time 0 before planning.
+    Paths list one position per timestep, so waiting repeats a position, and
+    agents leave the maze once they reach their goal. Agents that cannot
+    avoid the others within their horizon, or whose start is the start of an
+    earlier agent, get None.
+    """
+    started = perf_counter()
+    reservations = ReservationTable()
+    reverse = reversed_problem(problem)
+    cheapest = min(problem.neighborhood.costs)
+    heuristics: dict[Position, GoalDistances] = {}
+    paths: list[list[Position] | None] = []
+    nodes_visited = 0
+    claimed = [reservations.claim_start(problem.cell(start)) for start, _ in queries]
+
+    for (start, goal), has_start in zip(queries, claimed):
+        if not has_start:
+            paths.append(None)
+            continue
+        if goal not in heuristics:
+            heuristics[goal] = GoalDistances(reverse, problem.cell(goal))
+        heuristic = heuristics[goal]
+        free_cost = heuristic(problem.cell(start))
+        if math.isinf(free_cost):
+            paths.append(None)
+            continue
+        # the free path takes at most this many moves
+        free_moves = math.ceil(free_cost / cheapest)
+        horizon = COOPERATIVE_HORIZON_FACTOR * free_moves + COOPERATIVE_HORIZON_SLACK
+        cells, nodes = _space_time_a_star(
+            problem,
+            problem.cell(start),
+            problem.cell(goal),
+            reservations,
+            horizon,
+            heuristic,
+        )
+        nodes_visited += nodes
+        if cells is None:
+            paths.append(None)
+            continue
+        reservations.reserve(cells)
+        paths.append([problem.position(cell) for cell in cells])
+
+    nodes_visited += sum(heuristic.nodes_visited for heuristic in heuristics.values())
+    return BatchReport(paths, nodes_visited, len(heuristics), perf_counter() - started)
+
+
+def plan_batch(
+    problem: MazeProblem,
+    queries: Sequence[Query],
+    workers: int = 1,
+    cooperative: bool = False,
+) -> BatchReport:
+    """Plan paths for many (start, goal) queries on one maze.
+
+    Cooperative planning is sequential, so 'workers' only applies without it.
+    """
+    if cooperative:
+        return plan_cooperative(problem, queries)
+    return plan_independent(problem, queries, workers)
@@ -46,6 +46,10 @@ class Heap(Generic[T]):
         """Push an item into the heap."""
         heappush(self.items, DistanceItem(distance, item))
 
+    def peek(self) -> DistanceItem[T]:
+        """Return the item with lowest distance without popping."""
+        return self.items[0]
+
     def __len__(self):
         return len(self.items)
 
@@ -75,6 +79,9 @@ class Queue(Generic[T]):
     def __bool__(self) -> bool:
         return bool(self.items)
 
+    def __len__(self) -> int:
+        return len(self.items)
+
 
 @dataclass
 class Stack(Generic[T]):
@@ -101,6 +108,9 @@ class Stack(Generic[T]):
     def __bool__(self) -> bool:
         return bool(self.items)
 
+    def __len__(self) -> int:
+        return len(self.items)
+
 
 @dataclass
 class RandomList(Generic[T]):
@@ -128,3 +138,6 @@ class RandomList(Generic[T]):
 
     def __bool__(self):
         return bool(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
@@ -4,91 +4,94 @@ from typing import Iterator
 from mazefinder.problem import Position, MazeProblem
 from mazefinder.animate import Animator
 from .data_structures import Stack
+from .memory import search_memory
 
 
 def recursive_dfs(
     problem: MazeProblem, animator: Animator
 ) -> tuple[list[Position] | None, int]:
     """Search through state space using recursive Depth-First Search."""
-    visited: set[Position] = set()
-    previous: dict[Position, Position] = {}
-
-    def search(current: Position) -> bool:
-        """Recursive search element that returns whether a path to end was found."""
-        visited.add(current)
-        problem.grid.visit(current)
-        animator.next_frame(problem.grid)
-        if problem.is_goal(current):
-            return True
-        for neighbor in problem.adjacent(current):
-            if neighbor not in visited:
-                previous[neighbor] = current
-                if search(neighbor):
-                    return True
-        return False
-
-    try:
-        if search(problem.initial):
-            return problem.reconstruct_path(previous), len(visited)
-    except RecursionError:
-        print("Recursion depth exceeded. Maze is too deep for the current stack limit.")
-
-    return None, len(visited)
+    with search_memory(problem) as memory:
+        visited, parents = memory.visited, memory.parents
+
+        def search(current: int) -> int | None:
+            """Recursive search element that returns the goal reached, if any."""
+            visited.add(current)
+            problem.visit(current)
+            animator.next_frame(problem.grid)
+            if current in problem.goal_cells:
+                return current
+            for direction, neighbor in problem.neighbors(current):
+                if neighbor not in visited:
+                    parents[neighbor] = direction
+                    goal = search(neighbor)
+                    if goal is not None:
+                        return goal
+            return None
+
+        try:
+            goal = search(problem.initial_cell)
+            if goal is not None:
+                return problem.reconstruct_path(parents, goal), len(visited)
+        except RecursionError:
+            print("Recursion depth exceeded. Maze is too deep for the current stack limit.")
+
+        return None, len(visited)
 
 
 def stack_dfs(
     problem: MazeProblem, animator: Animator
 ) -> tuple[list[Position] | None, int]:
     """Search through state space using explicit stack Depth-First Search."""
-    stack: Stack[Position] = Stack([problem.initial])
-    visited: set[Position] = set()
-    previous: dict[Position, Position] = {}
-
-    while stack:
-        current = stack.pop()
-        if current in visited:
-            continue
-        visited.add(current)
-        problem.grid.visit(current)
-        if problem.is_goal(current):
-            return problem.reconstruct_path(previous), len(visited)
-        animator.next_frame(problem.grid)
-        for neighbor in problem.adjacent(current):
-            if neighbor not in visited:
-                previous[neighbor] = current
-                stack.push(neighbor)
-
-    return None, len(visited)
+    with search_memory(problem) as memory:
+        stack: Stack[int] = Stack([problem.initial_cell])
+        visited, parents = memory.visited, memory.parents
+
+        while stack:
+            current = stack.pop()
+            if current in visited:
+                continue
+            visited.add(current)
+            problem.visit(current)
+            if current in problem.goal_cells:
+                return problem.reconstruct_path(parents, current), len(visited)
+            animator.next_frame(problem.grid)
+            for direction, neighbor in problem.neighbors(current):
+                if neighbor not in visited:
+                    parents[neighbor] = direction
+                    stack.push(neighbor)
+
+        return None, len(visited)
 
 
 def iterator_dfs(
     problem: MazeProblem, animator: Animator
 ) -> tuple[list[Position] | None, int]:
     """Search through the state space using iterator Depth-First Search."""
-
-    stack: Stack[tuple[Position, Iterator[Position]]] = Stack(
-        [(problem.initial, problem.adjacent(problem.initial))]
-    )
-    visited: set[Position] = {problem.initial}
-    previous: dict[Position, Position] = {}
-
-    if problem.is_goal(problem.initial):
-        return problem.reconstruct_path(previous), len(visited)
-
-    while stack:
-        predecessor, children = stack.peek()
-        current = next(children, None)
-        if current is None:
-            stack.pop()
-            continue
-
-        if current not in visited:
-            visited.add(current)
-            problem.grid.visit(current)
-            animator.next_frame(problem.grid)
-            previous[current] = predecessor
-            if problem.is_goal(current):
-                return problem.reconstruct_path(previous), len(visited)
-            stack.push((current, problem.adjacent(current)))
-
-    return None, len(visited)
+    with search_memory(problem) as memory:
+        stack: Stack[tuple[int, Iterator[tuple[int, int]]]] = Stack(
+            [(problem.initial_cell, problem.neighbors(problem.initial_cell))]
+        )
+        visited, parents = memory.visited, memory.parents
+        visited.add(problem.initial_cell)
+
+        if problem.initial_cell in problem.goal_cells:
+            return problem.reconstruct_path(parents, problem.initial_cell), len(visited)
+
+        while stack:
+            _, children = stack.peek()
+            direction, current = next(children, (0, None))
+            if current is None:
+                stack.pop()
+                continue
+
+            if current not in visited:
+                visited.add(current)
+                problem.visit(current)
+                animator.next_frame(problem.grid)
+                parents[current] = direction
+                if current in problem.goal_cells:
+                    return problem.reconstruct_path(parents, current), len(visited)
+                stack.push((current, problem.neighbors(current)))
+
+        return None, len(visited)
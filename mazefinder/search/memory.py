@@ -0,0 +1,132 @@
+"""Support for compact per-cell search storage reused across runs."""
+
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import mmap
+from typing import Iterator
+from mazefinder.problem import MazeProblem
+
+# above this many cells per-cell arrays are backed by anonymous memory maps
+LAZY_ALLOCATION_CELLS = 1 << 24
+
+
+STAMP_LIMIT = (1 << 32) - 1  # largest generation an array('I') stamp holds
+BLOCK_BITS = 8  # a generation stamp covers 1 << BLOCK_BITS cells
+BLOCK_BYTES = (1 << BLOCK_BITS) >> 3
+
+
+def _allocate(typecode: str, size: int) -> array | memoryview:
+    """Return a zeroed per-cell array, memory-mapped above LAZY_ALLOCATION_CELLS."""
+    if size > LAZY_ALLOCATION_CELLS:
+        itemsize = array(typecode).itemsize
+        return memoryview(mmap.mmap(-1, size * itemsize)).cast(typecode)
+    return array(typecode, [0]) * size
+
+
+@dataclass
+class CellSet:
+    """Set of cell ids stored as a bitset with generation-stamped blocks.
+
+    Bits of a block only count when the block's stamp equals the current
+    generation, and a stale block is zeroed when a cell is first added to
+    it. Clearing the set only starts a new generation.
+    """
+
+    size: int
+    bits: bytearray = field(init=False, repr=False)
+    stamps: array | memoryview = field(init=False, repr=False)
+    generation: int = field(default=1, init=False)
+    count: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        """Allocate one bit per cell and one stamp per block."""
+        blocks = (self.size >> BLOCK_BITS) + 1
+        self.bits = bytearray(blocks * BLOCK_BYTES)
+        self.stamps = _allocate("I", blocks)
+
+    def __contains__(self, cell: int) -> bool:
+        """Return whether a cell is in the set."""
+        return self.stamps[cell >> BLOCK_BITS] == self.generation and bool(
+            self.bits[cell >> 3] & (1 << (cell & 7))
+        )
+
+    def add(self, cell: int):
+        """Add a cell to the set."""
+        block = cell >> BLOCK_BITS
+        if self.stamps[block] != self.generation:
+            self.stamps[block] = self.generation
+            start = block * BLOCK_BYTES
+            self.bits[start : start + BLOCK_BYTES] = bytes(BLOCK_BYTES)
+        mask = 1 << (cell & 7)
+        if not self.bits[cell >> 3] & mask:
+            self.bits[cell >> 3] |= mask
+            self.count += 1
+
+    def clear(self):
+        """Remove every cell from the set."""
+        self.count = 0
+        if self.generation == STAMP_LIMIT:
+            self.stamps = _allocate("I", len(self.stamps))
+            self.generation = 1
+        else:
+            self.generation += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+
+@dataclass
+class SearchMemory:
+    """Preallocated visited, distance and parent storage indexed by cell id.
+
+    Distances and parent directions are only meaningful for cells in
+    'visited', so a reset only starts new generations of the cell sets.
+    'closed' serves searches that also track expanded cells.
+    Grids above LAZY_ALLOCATION_CELLS keep their arrays in anonymous memory
+    maps, which only take memory for the pages a search touches.
+    """
+
+    size: int
+    typecode: str  # "i" for integral move costs, "d" otherwise
+    visited: CellSet = field(init=False)
+    closed: CellSet = field(init=False, repr=False)
+    distances: array | memoryview = field(init=False, repr=False)
+    parents: bytearray | mmap.mmap = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Allocate the per-cell arrays."""
+        self.visited = CellSet(self.size)
+        self.closed = CellSet(self.size)
+        self.distances = _allocate(self.typecode, self.size)
+        if self.size > LAZY_ALLOCATION_CELLS:
+            self.parents = mmap.mmap(-1, self.size)
+        else:
+            self.parents = bytearray(self.size)
+
+    def reset(self):
+        """Forget the previous run in constant time."""
+        self.visited.clear()
+        self.closed.clear()
+
+
+_pool: dict[tuple[int, str], list[SearchMemory]] = {}
+
+
+@contextmanager
+def search_memory(problem: MazeProblem) -> Iterator[SearchMemory]:
+    """Lend a reset search memory sized for the problem for one search.
+
+    One released memory is kept per size so that repeated runs reuse it.
+    The problem is told that a search starts, e.g. to reset its statistics.
+    """
+    key = (problem.size, "i" if problem.integral_costs else "d")
+    free = _pool.setdefault(key, [])
+    memory = free.pop() if free else SearchMemory(*key)
+    memory.reset()
+    problem.start_search()
+    try:
+        yield memory
+    finally:
+        if not free:
+            free.append(memory)
@@ -0,0 +1,72 @@
+"""Support for searches reaching several goals in a single pass."""
+
+from typing import Generator
+from mazefinder.animate import Animator
+from mazefinder.problem import MazeProblem, Position
+from ._a_star import a_star
+from .data_structures import Heap
+from ._dijkstra import dijkstra
+from .memory import search_memory
+from .stream import BATCH_SIZE, ExpansionBatch, run_steps
+
+
+def all_goals_steps(
+    problem: MazeProblem, batch_size: int = BATCH_SIZE
+) -> Generator[ExpansionBatch, None, tuple[dict[Position, list[Position] | None], int]]:
+    """Stream one Dijkstra pass that stops once every goal is settled."""
+    with search_memory(problem) as memory:
+        heap: Heap[int] = Heap([(0, problem.initial_cell)])
+        visited, distances, parents = memory.visited, memory.distances, memory.parents
+        visited.add(problem.initial_cell)
+        distances[problem.initial_cell] = 0
+        remaining = set(problem.goal_cells)
+        batch: list[int] = []
+        expanded = 0
+
+        while heap and remaining:
+            distance, current = heap.pop()
+            if distance > distances[current]:
+                continue
+            remaining.discard(current)
+            for direction, weight, neighbor in problem.neighbors_weighted(current):
+                total = distance + weight
+                if neighbor not in visited or total < distances[neighbor]:
+                    if neighbor not in visited:
+                        batch.append(neighbor)
+                    visited.add(neighbor)
+                    distances[neighbor] = total
+                    parents[neighbor] = direction
+                    heap.push(total, neighbor)
+            expanded += 1
+            if expanded % batch_size == 0:
+                yield ExpansionBatch(batch, len(heap))
+                batch = []
+
+        yield ExpansionBatch(batch, len(heap), final=True)
+        paths = {
+            problem.position(goal): (
+                None if goal in remaining else problem.reconstruct_path(parents, goal)
+            )
+            for goal in problem.goal_cells
+        }
+        return paths, len(visited)
+
+
+def all_goals(
+    problem: MazeProblem, animator: Animator
+) -> tuple[dict[Position, list[Position] | None], int]:
+    """Return shortest paths to every goal, None for unreachable ones."""
+    return run_steps(all_goals_steps(problem), problem, animator)
+
+
+def nearest_goal(
+    problem: MazeProblem, animator: Animator, method: str | None = None
+) -> tuple[list[Position] | None, int]:
+    """Return a shortest path to the nearest goal.
+
+    Without a method this runs Dijkstra's algorithm, otherwise A* guided by
+    the distance to the nearest goal.
+    """
+    if method is None:
+        return dijkstra(problem, animator)
+    return a_star(problem, animator, method)
@@ -0,0 +1,116 @@
+"""Support for incremental searches that stream their expansion progress."""
+
+from dataclasses import dataclass, field
+from math import inf
+from time import perf_counter
+from typing import Generator, Iterable, Iterator
+from mazefinder.animate import Animator
+from mazefinder.problem import MazeProblem, Position
+
+BATCH_SIZE = 64  # expansions per yielded batch
+
+SearchResult = tuple[list[Position] | None, int]
+
+
+@dataclass
+class ExpansionBatch:
+    """Cells first reached by a search since its previous batch."""
+
+    visited: list[int]
+    frontier_size: int
+    final: bool = False  # the search returns right after this batch
+
+
+SearchSteps = Generator[ExpansionBatch, None, SearchResult]
+
+
+def run_steps(
+    steps: SearchSteps, problem: MazeProblem, animator: Animator
+) -> SearchResult:
+    """Run a stepwise search to completion, animating every reached cell."""
+    while True:
+        try:
+            batch = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        for cell in batch.visited:
+            problem.visit(cell)
+            animator.next_frame(problem.grid)
+
+
+@dataclass
+class SearchStream:
+    """Pausable handle on a stepwise search with optional budgets.
+
+    The search only advances when 'step' or 'run' is called, so a caller can
+    pause it by not calling them. A stream over its node or time budget is
+    cancelled before its next batch, while a search that already ended keeps
+    its result. Both budgets are soft limits: the batch that crosses one is
+    completed, so a search may pass its node budget by the cells reached in
+    one batch of up to 'batch_size' expansions.
+    """
+
+    steps: SearchSteps
+    node_budget: float = inf
+    time_budget: float = inf
+
+    result: SearchResult | None = field(default=None, init=False)
+    cancelled: bool = field(default=False, init=False)
+    nodes_reached: int = field(default=1, init=False)  # counts the initial cell
+    elapsed: float = field(default=0.0, init=False)
+
+    @property
+    def done(self) -> bool:
+        """Return whether the search finished or was cancelled."""
+        return self.result is not None or self.cancelled
+
+    def step(self) -> ExpansionBatch | None:
+        """Advance the search by one batch, return None once it is done."""
+        if self.done:
+            return None
+        if self.nodes_reached > self.node_budget or self.elapsed > self.time_budget:
+            self.cancel()
+            return None
+        started = perf_counter()
+        try:
+            batch = next(self.steps)
+        except StopIteration as stop:
+            self.result = stop.value
+            return None
+        finally:
+            self.elapsed += perf_counter() - started
+        self.nodes_reached += len(batch.visited)
+        if batch.final:
+            try:
+                next(self.steps)
+            except StopIteration as stop:
+                self.result = stop.value
+        return batch
+
+    def run(self, max_batches: float = inf) -> Iterator[ExpansionBatch]:
+        """Yield up to 'max_batches' batches, leaving the stream paused after."""
+        count = 0
+        while count < max_batches:
+            batch = self.step()
+            if batch is None:
+                return
+            count += 1
+            yield batch
+
+    def cancel(self):
+        """Stop the search and release its memory."""
+        self.steps.close()
+        self.cancelled = True
+
+
+def interleave(
+    streams: Iterable[SearchStream],
+) -> Iterator[tuple[SearchStream, ExpansionBatch]]:
+    """Advance streams round-robin one batch at a time until all are done."""
+    active = list(streams)
+    while active:
+        for stream in active:
+            batch = stream.step()
+            if batch is not None:
+                yield stream, batch
+        active = [stream for stream in active if not stream.done]
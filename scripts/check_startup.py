@@ -0,0 +1,66 @@
+"""Check that importing the CLI stays within a startup time budget.
+
+Runs `python -X importtime -c "import main"` several times, reports the
+median cumulative import time of `main` and fails when it exceeds the budget
+or when a search algorithm module is imported eagerly.
+"""
+
+import argparse
+from pathlib import Path
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+LAZY_PREFIX = "mazefinder.search."
+BUDGET_MS_DEFAULT = 100.0
+RUNS_DEFAULT = 5
+
+
+def measure() -> tuple[float, list[str]]:
+    """Return the cumulative import time of main in ms and imported modules."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total, modules = 0.0, []
+    for line in completed.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        modules.append(match.group(4))
+        if match.group(4) == "main":
+            total = int(match.group(2)) / 1000
+    return total, modules
+
+
+def main():
+    """Run the startup check."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS_DEFAULT)
+    parser.add_argument("--runs", type=int, default=RUNS_DEFAULT)
+    args = parser.parse_args()
+
+    timings, modules = [], []
+    for _ in range(args.runs):
+        total, modules = measure()
+        timings.append(total)
+    median = statistics.median(timings)
+    print(f"import main: median {median:.1f} ms over {args.runs} runs")
+
+    eager = [module for module in modules if module.startswith(LAZY_PREFIX)]
+    if eager:
+        print(f"search modules imported at startup: {', '.join(eager)}")
+        sys.exit(1)
+    if median > args.budget_ms:
+        print(f"startup budget of {args.budget_ms:.1f} ms exceeded")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()